@@ -58,8 +58,9 @@ print("Unsigned Claim Transaction Fee:", unsigned_claim_transaction.fee(unit="NE
 print("Unsigned Claim Transaction Hash:", unsigned_claim_transaction.hash())
 print("Unsigned Claim Transaction Main Raw:", unsigned_claim_transaction.raw())
 # print("Unsigned Claim Transaction Json:", json.dumps(unsigned_claim_transaction.json(), indent=4))
-print("Unsigned Claim Transaction Unsigned Datas:", json.dumps(unsigned_claim_transaction.unsigned_datas(), indent=4))
-print("Unsigned Claim Transaction Signatures:", json.dumps(unsigned_claim_transaction.signatures(), indent=4))
+print("Unsigned Claim Transaction Unsigned Datas & Signatures:", json.dumps(dict(
+    unsigned_datas=unsigned_claim_transaction.unsigned_datas(), signatures=unsigned_claim_transaction.signatures()
+), indent=4))
 print("Unsigned Claim Transaction Type:", unsigned_claim_transaction.type())
 
 unsigned_claim_transaction_raw: str = unsigned_claim_transaction.transaction_raw()
@@ -81,8 +82,9 @@ print("Signed Claim Transaction Fee:", signed_claim_transaction.fee(unit="NEU"),
 print("Signed Claim Transaction Hash:", signed_claim_transaction.hash())
 print("Signed Claim Transaction Main Raw:", signed_claim_transaction.raw())
 # print("Signed Claim Transaction Json:", json.dumps(signed_claim_transaction.json(), indent=4))
-print("Signed Claim Transaction Unsigned Datas:", json.dumps(signed_claim_transaction.unsigned_datas(), indent=4))
-print("Signed Claim Transaction Signatures:", json.dumps(signed_claim_transaction.signatures(), indent=4))
+print("Signed Claim Transaction Unsigned Datas & Signatures:", json.dumps(dict(
+    unsigned_datas=signed_claim_transaction.unsigned_datas(), signatures=signed_claim_transaction.signatures()
+), indent=4))
 print("Signed Claim Transaction Type:", signed_claim_transaction.type())
 
 signed_claim_transaction_raw: str = signed_claim_transaction.transaction_raw()
@@ -92,25 +94,28 @@ print("=" * 10, "Claim Signature")
 
 # Initialize claim signature
 claim_signature: ClaimSignature = ClaimSignature(network=NETWORK)
-# Sign unsigned claim transaction raw
-claim_signature.sign(
-    transaction_raw=unsigned_claim_transaction_raw,
-    solver=claim_solver
+# Reuse signed claim transaction, instead of signing unsigned claim transaction raw again
+claim_signature.from_signed_transaction(
+    transaction=signed_claim_transaction
 )
 
 print("Claim Signature Fee:", claim_signature.fee(unit="NEU"), "NEU")
 print("Claim Signature Hash:", claim_signature.hash())
 print("Claim Signature Main Raw:", claim_signature.raw())
 # print("Claim Signature Json:", json.dumps(claim_signature.json(), indent=4))
-print("Claim Signature Unsigned Datas:", json.dumps(claim_signature.unsigned_datas(), indent=4))
-print("Claim Signature Signatures:", json.dumps(claim_signature.signatures(), indent=4))
+print("Claim Signature Unsigned Datas & Signatures:", json.dumps(dict(
+    unsigned_datas=claim_signature.unsigned_datas(), signatures=claim_signature.signatures()
+), indent=4))
 print("Claim Signature Type:", claim_signature.type())
 
 signed_claim_signature_transaction_raw: str = claim_signature.transaction_raw()
 print("Claim Signature Transaction Raw:", signed_claim_signature_transaction_raw)
 
-# Check both signed claim transaction raws are equal
-assert signed_claim_transaction_raw == signed_claim_signature_transaction_raw
+# Check both signed claim transaction raws are equal by signing again (skipped with python -O)
+assert signed_claim_transaction_raw == ClaimSignature(network=NETWORK).sign(
+    transaction_raw=unsigned_claim_transaction_raw,
+    solver=claim_solver
+).transaction_raw()
 
 # Submit claim transaction raw
 # print("\nSubmitted Claim Transaction:", json.dumps(submit_transaction_raw(
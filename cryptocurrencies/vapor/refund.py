@@ -56,8 +56,9 @@ print("Unsigned Refund Transaction Fee:", unsigned_refund_transaction.fee(unit="
 print("Unsigned Refund Transaction Hash:", unsigned_refund_transaction.hash())
 print("Unsigned Refund Transaction Main Raw:", unsigned_refund_transaction.raw())
 # print("Unsigned Refund Transaction Json:", json.dumps(unsigned_refund_transaction.json(), indent=4))
-print("Unsigned Refund Transaction Unsigned:", json.dumps(unsigned_refund_transaction.unsigned_datas(), indent=4))
-print("Unsigned Refund Transaction Signatures:", json.dumps(unsigned_refund_transaction.signatures(), indent=4))
+print("Unsigned Refund Transaction Unsigned Datas & Signatures:", json.dumps(dict(
+    unsigned_datas=unsigned_refund_transaction.unsigned_datas(), signatures=unsigned_refund_transaction.signatures()
+), indent=4))
 print("Unsigned Refund Transaction Type:", unsigned_refund_transaction.type())
 
 unsigned_refund_transaction_raw: str = unsigned_refund_transaction.transaction_raw()
@@ -78,8 +79,9 @@ print("Signed Refund Transaction Fee:", signed_refund_transaction.fee(unit="NEU"
 print("Signed Refund Transaction Hash:", signed_refund_transaction.hash())
 print("Signed Refund Transaction Main Raw:", signed_refund_transaction.raw())
 # print("Signed Refund Transaction Json:", json.dumps(signed_refund_transaction.json(), indent=4))
-print("Signed Refund Transaction Unsigned Datas:", json.dumps(signed_refund_transaction.unsigned_datas(), indent=4))
-print("Signed Refund Transaction Signatures:", json.dumps(signed_refund_transaction.signatures(), indent=4))
+print("Signed Refund Transaction Unsigned Datas & Signatures:", json.dumps(dict(
+    unsigned_datas=signed_refund_transaction.unsigned_datas(), signatures=signed_refund_transaction.signatures()
+), indent=4))
 print("Signed Refund Transaction Type:", signed_refund_transaction.type())
 
 signed_refund_transaction_raw: str = signed_refund_transaction.transaction_raw()
@@ -89,25 +91,28 @@ print("=" * 10, "Refund Signature")
 
 # Initialize refund signature
 refund_signature: RefundSignature = RefundSignature(network=NETWORK)
-# Sign unsigned refund transaction raw
-refund_signature.sign(
-    transaction_raw=unsigned_refund_transaction_raw,
-    solver=refund_solver
+# Reuse signed refund transaction, instead of signing unsigned refund transaction raw again
+refund_signature.from_signed_transaction(
+    transaction=signed_refund_transaction
 )
 
 print("Refund Signature Fee:", refund_signature.fee(unit="NEU"), "NEU")
 print("Refund Signature Hash:", refund_signature.hash())
 print("Refund Signature Main Raw:", refund_signature.raw())
 # print("Refund Signature Json:", json.dumps(refund_signature.json(), indent=4))
-print("Refund Signature Unsigned Datas:", json.dumps(refund_signature.unsigned_datas(), indent=4))
-print("Refund Signature Signatures:", json.dumps(refund_signature.signatures(), indent=4))
+print("Refund Signature Unsigned Datas & Signatures:", json.dumps(dict(
+    unsigned_datas=refund_signature.unsigned_datas(), signatures=refund_signature.signatures()
+), indent=4))
 print("Refund Signature Type:", refund_signature.type())
 
 signed_refund_signature_transaction_raw: str = refund_signature.transaction_raw()
 print("Refund Signature Transaction Raw:", signed_refund_signature_transaction_raw)
 
-# Check both signed refund transaction raws are equal
-assert signed_refund_transaction_raw == signed_refund_signature_transaction_raw
+# Check both signed refund transaction raws are equal by signing again (skipped with python -O)
+assert signed_refund_transaction_raw == RefundSignature(network=NETWORK).sign(
+    transaction_raw=unsigned_refund_transaction_raw,
+    solver=refund_solver
+).transaction_raw()
 
 # Submit refund transaction raw
 # print("\nSubmitted Refund Transaction:", json.dumps(submit_transaction_raw(
@@ -36,6 +36,9 @@ setup(
             "pytest>=6.1.2,<7",
             "pytest-cov>=2.10.1,<3"
         ],
+        "orjson": [
+            "orjson>=3.4.0,<4"
+        ],
         "docs": [
             "sphinx>=3.3.1,<4",
             "sphinx_rtd_theme>=0.5.0,<1",
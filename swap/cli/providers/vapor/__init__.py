@@ -8,6 +8,7 @@ from .htlc import htlc
 from .fund import fund
 from .claim import claim
 from .refund import refund
+from .refund_batch import refund_many
 from .decode import decode
 from .signature import sign
 from .submit import submit
@@ -24,6 +25,7 @@ vapor.add_command(htlc)
 vapor.add_command(fund)
 vapor.add_command(claim)
 vapor.add_command(refund)
+vapor.add_command(refund_many)
 vapor.add_command(decode)
 vapor.add_command(sign)
 vapor.add_command(submit)
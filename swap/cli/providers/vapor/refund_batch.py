@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import sys
+
+from ....cli import click
+from ....providers.vapor.transaction import RefundTransaction
+from ....providers.vapor.utils import amount_unit_converter
+from ....providers.config import vapor as config
+
+
+@click.command("refund-many", options_metavar="[OPTIONS]",
+               short_help="Select Vapor Refund transactions batch builder.")
+@click.option("-a", "--address", type=str, required=True, help="Set Vapor sender address.")
+@click.option("-f", "--file", "rows", type=click.File("r"), required=True,
+              help="Set file of 'transaction_id[,amount]' rows, one funded transaction per line.")
+@click.option("-ma", "--max-amount", type=bool, default=True,
+              help="Set Vapor refund max amount.", show_default=True)
+@click.option("-u", "--unit", type=str, default=config["unit"],
+              help="Set Vapor refund amount unit.", show_default=True)
+@click.option("-as", "--asset", type=str, default=config["asset"],
+              help="Set Vapor asset id.", show_default=True)
+@click.option("-n", "--network", type=str, default=config["network"],
+              help="Set Vapor network.", show_default=True)
+def refund_many(address: str, rows, max_amount: bool, unit: str, asset: str, network: str):
+    try:
+        # One refund transaction builder for all rows
+        refund_transaction: RefundTransaction = RefundTransaction(network=network)
+    except Exception as exception:
+        click.echo(click.style("Error: {}")
+                   .format(str(exception)), err=True)
+        sys.exit(1)
+
+    failed_rows: int = 0
+    for line_number, row in enumerate(rows, start=1):
+        row = row.strip()
+        if not row or row.startswith("#"):
+            continue
+        transaction_id, _, amount = row.partition(",")
+        transaction_id = transaction_id.strip()
+        try:
+            amount = float(amount) if amount.strip() else 0
+            click.echo(
+                refund_transaction.build_transaction(
+                    address=address,
+                    transaction_id=transaction_id,
+                    amount=(int(amount) if unit == "NEU" else amount_unit_converter(
+                        amount=amount, unit_from=f"{unit}2NEU"
+                    )),
+                    max_amount=max_amount,
+                    asset=asset
+                ).transaction_raw()
+            )
+        except Exception as exception:
+            # Report the row and keep building the rest of the batch
+            failed_rows += 1
+            click.echo(click.style("Error: row {} ({}): {}")
+                       .format(line_number, transaction_id, str(exception)), err=True)
+    if failed_rows:
+        # Non-zero exit status, so callers can tell a partial batch from a complete one
+        sys.exit(1)
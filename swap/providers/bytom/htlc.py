@@ -70,6 +70,7 @@ class HTLC:
                                "choose only 'mainnet', 'solonet' or 'testnet' networks.")
         self._network: str = network
         self._script: Optional[Equity, dict] = None
+        self._hash: Optional[str] = None
 
     def build_htlc(self, secret_hash: str, recipient_public_key: str, sender_public_key: str,
                    sequence: int = config["sequence"], use_script: bool = False) -> "HTLC":
@@ -104,6 +105,7 @@ class HTLC:
         if len(sender_public_key) != 64:
             raise ValueError("Invalid Bitcoin sender public key, length must be 64")
 
+        self._hash = None
         if use_script:
             HTLC_AGREEMENTS: List[str, int] = [
                 secret_hash,
@@ -150,7 +152,7 @@ class HTLC:
         <swap.providers.bitcoin.htlc.HTLC object at 0x0409DAF0>
         """
         
-        self._script = dict(program=bytecode)
+        self._script, self._hash = dict(program=bytecode), None
         return self
 
     def bytecode(self) -> str:
@@ -207,7 +209,10 @@ class HTLC:
 
         if not self._script or "program" not in self._script:
             raise ValueError("HTLC script is None, first build HTLC.")
-        return get_script_hash(bytecode=self.bytecode())
+        # Script is immutable until rebuilt, hash it once for address, balance and utxos
+        if self._hash is None:
+            self._hash = get_script_hash(bytecode=self.bytecode())
+        return self._hash
 
     def address(self) -> str:
         """
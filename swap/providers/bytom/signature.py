@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 
-from base64 import (
-    b64encode, b64decode
-)
+from base64 import b64encode
 from typing import (
     Optional, Union, List
 )
@@ -20,7 +18,7 @@ from .solver import (
 )
 from .rpc import decode_raw
 from .utils import (
-    is_network, is_transaction_raw, amount_unit_converter
+    is_network, amount_unit_converter, load_transaction_raw
 )
 
 
@@ -37,6 +35,9 @@ class Signature(Transaction):
         Bytom has only three networks, ``mainnet``, ``solonet`` and ``testnet``.
     """
 
+    # Signed transaction type accepted by from_signed_transaction, None accepts any
+    _signed_type: Optional[str] = None
+
     def __init__(self, network: str = config["network"]):
 
         if not is_network(network=network):
@@ -188,12 +189,11 @@ class Signature(Transaction):
         <swap.providers.bytom.signature.FundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: Optional[dict] = load_transaction_raw(transaction_raw=transaction_raw)
+        if loaded_transaction_raw is None:
             raise TransactionRawError("Invalid Bytom unsigned transaction raw.")
 
         transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
 
         self._type = loaded_transaction_raw["type"]
         if loaded_transaction_raw["type"] == "bytom_normal_unsigned":
@@ -213,6 +213,49 @@ class Signature(Transaction):
                 transaction_raw=transaction_raw, solver=solver
             )
 
+    def from_signed_transaction(self, transaction: Transaction) \
+            -> Union["Signature", "NormalSignature", "FundSignature", "ClaimSignature", "RefundSignature"]:
+        """
+        Initialize signature from already signed transaction, without signing it again.
+
+        :param transaction: Bytom signed transaction.
+        :type transaction: bytom.transaction.NormalTransaction, bytom.transaction.FundTransaction, bytom.transaction.ClaimTransaction, bytom.transaction.RefundTransaction
+
+        :returns: Signature -- Bytom signature instance.
+
+        >>> from swap.providers.bytom.signature import ClaimSignature
+        >>> claim_signature = ClaimSignature("mainnet")
+        >>> claim_signature.from_signed_transaction(signed_claim_transaction)
+        <swap.providers.bytom.signature.ClaimSignature object at 0x0409DAF0>
+        """
+
+        # Check parameter instances
+        if not isinstance(transaction, Transaction):
+            raise TypeError(f"Transaction must be Bytom Transaction, not {type(transaction).__name__} type.")
+        if not transaction.type().endswith("_signed"):
+            raise ValueError("Transaction is not signed, sign transaction first.")
+        if self._signed_type is not None and transaction.type() != self._signed_type:
+            kind: str = self._signed_type.split("_")[1]
+            raise TypeError(f"Invalid Bytom {kind} signed transaction type, "
+                            f"you can't use {transaction.type()} type by using {kind} signature.")
+
+        # Reuse signed transaction raw, signatures are already computed
+        signed_transaction_raw: str = transaction.transaction_raw()
+        loaded_transaction_raw: Optional[dict] = load_transaction_raw(transaction_raw=signed_transaction_raw)
+        if loaded_transaction_raw is None:
+            raise TransactionRawError("Invalid Bytom signed transaction raw.")
+        if loaded_transaction_raw["network"] != self._network:
+            raise NetworkError(f"Invalid Bytom '{loaded_transaction_raw['network']}' transaction network",
+                               f"this signature is for '{self._network}' network.")
+
+        # Set transaction, fee, type and signatures
+        self._fee, self._type, self._datas, self._transaction, self._signatures = (
+            loaded_transaction_raw["fee"], loaded_transaction_raw["type"], loaded_transaction_raw["datas"],
+            loaded_transaction_raw, loaded_transaction_raw["signatures"]
+        )
+        self._signed_raw = signed_transaction_raw
+        return self
+
     def unsigned_datas(self, *args, **kwargs) -> List[dict]:
         """
         Get Bytom transaction unsigned datas with instruction.
@@ -292,6 +335,8 @@ class NormalSignature(Signature):
     :returns: NormalSignature -- Bytom normal signature instance.
     """
 
+    _signed_type: Optional[str] = "bytom_normal_signed"
+
     def __init__(self, network: str = config["network"]):
         super().__init__(network=network)
 
@@ -316,12 +361,11 @@ class NormalSignature(Signature):
         <swap.providers.bytom.signature.NormalSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: Optional[dict] = load_transaction_raw(transaction_raw=transaction_raw)
+        if loaded_transaction_raw is None:
             raise TransactionRawError("Invalid Bytom unsigned transaction raw.")
 
         transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
 
         if not loaded_transaction_raw["type"] == "bytom_normal_unsigned":
             raise TypeError(f"Invalid Bytom normal unsigned transaction raw type, "
@@ -383,6 +427,8 @@ class FundSignature(Signature):
     :returns: FundSignature -- Bytom fund signature instance.
     """
 
+    _signed_type: Optional[str] = "bytom_fund_signed"
+
     def __init__(self, network: str = config["network"]):
         super().__init__(network=network)
 
@@ -407,12 +453,11 @@ class FundSignature(Signature):
         <swap.providers.bytom.signature.FundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: Optional[dict] = load_transaction_raw(transaction_raw=transaction_raw)
+        if loaded_transaction_raw is None:
             raise TransactionRawError("Invalid Bytom unsigned transaction raw.")
 
         transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
 
         if not loaded_transaction_raw["type"] == "bytom_fund_unsigned":
             raise TypeError(f"Invalid Bytom fund unsigned transaction raw type, "
@@ -474,6 +519,8 @@ class ClaimSignature(Signature):
     :returns: ClaimSignature -- Bytom claim signature instance.
     """
 
+    _signed_type: Optional[str] = "bytom_claim_signed"
+
     def __init__(self, network: str = config["network"]):
         super().__init__(network=network)
 
@@ -499,12 +546,11 @@ class ClaimSignature(Signature):
         <swap.providers.bytom.signature.ClaimSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: Optional[dict] = load_transaction_raw(transaction_raw=transaction_raw)
+        if loaded_transaction_raw is None:
             raise TransactionRawError("Invalid Bytom unsigned transaction raw.")
 
         transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
 
         if not loaded_transaction_raw["type"] == "bytom_claim_unsigned":
             raise TypeError(f"Invalid Bytom claim unsigned transaction raw type, "
@@ -522,6 +568,8 @@ class ClaimSignature(Signature):
 
         # Set recipient wallet
         wallet, secret, path, indexes = solver.solve()
+        # Secret and witness are the same for every input, compute them once
+        secret_hex, witness = bytearray(secret.encode()).hex(), solver.witness(self._network)
         # Clean derivation indexes/path
         wallet.clean_derivation()
         # Sign claim transaction
@@ -535,10 +583,10 @@ class ClaimSignature(Signature):
             elif indexes:
                 wallet.from_indexes(indexes)
             for unsigned_data in unsigned_datas:
-                signed_data.append(bytearray(secret.encode()).hex())
+                signed_data.append(secret_hex)
                 signed_data.append(wallet.sign(unsigned_data))
                 signed_data.append(str("00"))
-                signed_data.append(solver.witness(self._network))
+                signed_data.append(witness)
             self._signatures.append(signed_data)
             wallet.clean_derivation()
 
@@ -569,6 +617,8 @@ class RefundSignature(Signature):
     :returns: RefundSignature -- Bytom claim signature instance.
     """
 
+    _signed_type: Optional[str] = "bytom_refund_signed"
+
     def __init__(self, network: str = config["network"]):
         super().__init__(network=network)
 
@@ -594,12 +644,11 @@ class RefundSignature(Signature):
         <swap.providers.bytom.signature.RefundSignature object at 0x0409DAF0>
         """
 
-        if not is_transaction_raw(transaction_raw=transaction_raw):
+        loaded_transaction_raw: Optional[dict] = load_transaction_raw(transaction_raw=transaction_raw)
+        if loaded_transaction_raw is None:
             raise TransactionRawError("Invalid Bytom unsigned transaction raw.")
 
         transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
 
         if not loaded_transaction_raw["type"] == "bytom_refund_unsigned":
             raise TypeError(f"Invalid Bytom refund unsigned transaction raw type, "
@@ -617,6 +666,8 @@ class RefundSignature(Signature):
 
         # Set recipient wallet
         wallet, path, indexes = solver.solve()
+        # Witness is the same for every input, compute it once
+        witness = solver.witness(self._network)
         # Clean derivation indexes/path
         wallet.clean_derivation()
         # Sign refund transaction
@@ -632,7 +683,7 @@ class RefundSignature(Signature):
             for unsigned_data in unsigned_datas:
                 signed_data.append(wallet.sign(unsigned_data))
                 signed_data.append(str("01"))
-                signed_data.append(solver.witness(self._network))
+                signed_data.append(witness)
             self._signatures.append(signed_data)
             wallet.clean_derivation()
 
@@ -2,7 +2,7 @@
 
 from pybytom.wallet import Wallet
 from typing import (
-    Optional, List, Tuple
+    Optional, List, Tuple, Union, Dict
 )
 
 from ..config import bytom as config
@@ -106,7 +106,7 @@ class ClaimSolver:
     :param secret_key: Secret password/passphrase.
     :type secret_key: str
     :param bytecode: Bytom witness HTLC bytecode, defaults to None.
-    :type bytecode: str
+    :type bytecode: str, bytes
     :param account: Bytom derivation account, defaults to 1.
     :type account: int
     :param change: Bytom derivation change, defaults to False.
@@ -125,9 +125,12 @@ class ClaimSolver:
     >>> bytecode = "02e8032091ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2203e0a377ae4afa031d4551599d9bb7d5b27f4736d77f78cac4d476f0ffba5ae3e203a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb741f547a6416000000557aa888537a7cae7cac631f000000537acd9f6972ae7cac00c0"
     >>> claim_solver = ClaimSolver(xprivate_key=recipient_xprivate_key, secret_key="Hello Meheret!", bytecode=bytecode)
     <swap.providers.bytom.solver.ClaimSolver object at 0x03FCCA60>
+
+    .. note::
+        Bytom signs with Ed25519, signatures are deterministic and need no nonce or low-s handling.
     """
 
-    def __init__(self, xprivate_key: str, secret_key: str, bytecode: str,
+    def __init__(self, xprivate_key: str, secret_key: str, bytecode: Union[str, bytes],
                  account: int = 1, change: bool = False, address: int = 1,
                  path: Optional[str] = None, indexes: Optional[List[str]] = None):
         if path is None and not indexes:
@@ -139,7 +142,8 @@ class ClaimSolver:
         self._secret_key: str = secret_key
         self._path: Optional[str] = path
         self._indexes: Optional[List[str]] = indexes
-        self._bytecode: str = bytecode
+        self._bytecode: str = bytecode.hex() if isinstance(bytecode, bytes) else bytecode
+        self._witnesses: Dict[str, str] = {}
 
     def solve(self, network: str = config["network"]) -> Tuple[Wallet, str, Optional[str], Optional[List[str]]]:
         return (
@@ -149,9 +153,11 @@ class ClaimSolver:
         )
 
     def witness(self, network: str = config["network"]) -> str:
-        return HTLC(network=network).from_bytecode(
-            bytecode=self._bytecode
-        ).bytecode()
+        if network not in self._witnesses:
+            self._witnesses[network] = HTLC(network=network).from_bytecode(
+                bytecode=self._bytecode
+            ).bytecode()
+        return self._witnesses[network]
 
 
 class RefundSolver:
@@ -161,7 +167,7 @@ class RefundSolver:
     :param xprivate_key: Bytom sender xprivate key.
     :type xprivate_key: str
     :param bytecode: Bytom witness HTLC bytecode, defaults to None.
-    :type bytecode: str
+    :type bytecode: str, bytes
     :param account: Bytom derivation account, defaults to 1.
     :type account: int
     :param change: Bytom derivation change, defaults to False.
@@ -180,9 +186,12 @@ class RefundSolver:
     >>> bytecode = "02e8032091ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2203e0a377ae4afa031d4551599d9bb7d5b27f4736d77f78cac4d476f0ffba5ae3e203a26da82ead15a80533a02696656b14b5dbfd84eb14790f2e1be5e9e45820eeb741f547a6416000000557aa888537a7cae7cac631f000000537acd9f6972ae7cac00c0"
     >>> refund_solver = RefundSolver(xprivate_key=sender_xprivate_key, bytecode=bytecode)
     <swap.providers.bytom.solver.RefundSolver object at 0x03FCCA60>
+
+    .. note::
+        Bytom signs with Ed25519, signatures are deterministic and need no nonce or low-s handling.
     """
 
-    def __init__(self, xprivate_key: str, bytecode: str,
+    def __init__(self, xprivate_key: str, bytecode: Union[str, bytes],
                  account: int = 1, change: bool = False, address: int = 1,
                  path: Optional[str] = None, indexes: Optional[List[str]] = None):
         if path is None and not indexes:
@@ -193,7 +202,8 @@ class RefundSolver:
         self._xprivate_key: str = xprivate_key
         self._path: Optional[str] = path
         self._indexes: Optional[List[str]] = indexes
-        self._bytecode: str = bytecode
+        self._bytecode: str = bytecode.hex() if isinstance(bytecode, bytes) else bytecode
+        self._witnesses: Dict[str, str] = {}
 
     def solve(self, network: str = config["network"]) -> Tuple[Wallet, Optional[str], Optional[List[str]]]:
         return (
@@ -203,6 +213,8 @@ class RefundSolver:
         )
 
     def witness(self, network: str = config["network"]) -> str:
-        return HTLC(network=network).from_bytecode(
-            bytecode=self._bytecode
-        ).bytecode()
+        if network not in self._witnesses:
+            self._witnesses[network] = HTLC(network=network).from_bytecode(
+                bytecode=self._bytecode
+            ).bytecode()
+        return self._witnesses[network]
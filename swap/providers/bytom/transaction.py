@@ -9,7 +9,7 @@ from pybytom.wallet.tools import (
 )
 from base64 import b64encode
 from typing import (
-    Optional, Union, List
+    Optional, Union, List, Dict, Tuple, Any
 )
 
 import json
@@ -27,7 +27,7 @@ from .solver import (
     NormalSolver, FundSolver, ClaimSolver, RefundSolver
 )
 from .utils import (
-    amount_unit_converter, is_network, is_address, get_address_type
+    amount_unit_converter, is_network, is_address
 )
 
 
@@ -155,7 +155,7 @@ class Transaction(BytomTransaction):
             raise ValueError("transaction script is none, build transaction first.")
         return self._type
 
-    def unsigned_datas(self, detail: bool = False) -> List[dict]:
+    def unsigned_datas(self, detail: bool = False) -> List[Dict[str, Any]]:
         """
         Get Bytom transaction unsigned datas(messages) with instruction.
 
@@ -179,34 +179,24 @@ class Transaction(BytomTransaction):
         if self._transaction is None:
             raise ValueError("Transaction is none, build transaction first.")
 
-        unsigned_datas: List[dict] = []
+        unsigned_datas: List[Dict[str, Any]] = []
+        # Public key -> (program, address), inputs of one sender share the same key
+        programs: Dict[str, Tuple[str, str]] = {}
         for signing_instruction in self._transaction["signing_instructions"]:
-            unsigned_data = dict(datas=signing_instruction["sign_data"])
-            if "pubkey" in signing_instruction and signing_instruction["pubkey"]:
-                unsigned_data.setdefault("public_key", signing_instruction["pubkey"])
-                if detail:
-                    program = get_program(public_key=signing_instruction["pubkey"])
-                    address = get_address(program=program, network=self._network)
-                    unsigned_data.setdefault("program", program)
-                    unsigned_data.setdefault("address", address)
-                else:
-                    unsigned_data.setdefault("network", self._network)
+            public_key: Optional[str] = signing_instruction.get("pubkey") or None
+            indexes: Optional[List[str]] = signing_instruction.get("derivation_path") or None
+            unsigned_data: Dict[str, Any] = dict(datas=signing_instruction["sign_data"])
+            if detail:
+                if public_key is not None and public_key not in programs:
+                    program = get_program(public_key=public_key)
+                    programs[public_key] = (program, get_address(program=program, network=self._network))
+                program, address = programs[public_key] if public_key is not None else (None, None)
+                unsigned_data.update(public_key=public_key, program=program, address=address, indexes=indexes)
             else:
-                if detail:
-                    unsigned_data.setdefault("public_key", None)
-                    unsigned_data.setdefault("program", None)
-                    unsigned_data.setdefault("address", None)
-                else:
-                    unsigned_data.setdefault("network", self._network)
-            if "derivation_path" in signing_instruction and signing_instruction["derivation_path"]:
-                path = indexes_to_path(indexes=signing_instruction["derivation_path"])
-                if detail:
-                    unsigned_data.setdefault("indexes", signing_instruction["derivation_path"])
-                unsigned_data.setdefault("path", path)
-            else:
-                if detail:
-                    unsigned_data.setdefault("indexes", None)
-                unsigned_data.setdefault("path", None)
+                if public_key is not None:
+                    unsigned_data["public_key"] = public_key
+                unsigned_data["network"] = self._network
+            unsigned_data["path"] = indexes_to_path(indexes=indexes) if indexes is not None else None
             # Append unsigned datas
             unsigned_datas.append(unsigned_data)
 
@@ -513,7 +503,7 @@ class FundTransaction(Transaction):
         # Check parameter instances
         if not is_address(address, self._network):
             raise AddressError(f"Invalid Bytom sender '{address}' {self._network} address.")
-        if not is_address(htlc_address, self._network) or get_address_type(htlc_address) != "p2wsh":
+        if not is_address(htlc_address, self._network, "p2wsh"):
             raise AddressError(f"Invalid Bytom HTLC '{htlc_address}' {self._network} P2WSH address.")
         if unit not in ["BTM", "mBTM", "NEU"]:
             raise UnitError("Invalid Bytom unit, choose only 'BTM', 'mBTM' or 'NEU' units.")
@@ -1,19 +1,79 @@
 #!/usr/bin/env python3
 
 from base64 import b64decode
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from pybytom.utils import is_address as btm_is_address
-from typing import Optional, Union
+from typing import Optional, Union, Dict, Tuple
 
 import requests
-import json
 import datetime
+import binascii
 
-from ...utils import clean_transaction_raw
+from ...utils import (
+    clean_transaction_raw, json_loads, json_dumps
+)
 from ...exceptions import (
     NetworkError, APIError, TransactionRawError, UnitError, AddressError
 )
 from ..config import bytom as config
 
+# Shared HTTP session, keeps Bytom API connections alive between requests
+_SESSION: requests.Session = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
+# Bytom transaction raw types
+_TRANSACTION_RAW_TYPES: frozenset = frozenset([
+    "bytom_normal_unsigned", "bytom_normal_signed",
+    "bytom_fund_unsigned", "bytom_fund_signed",
+    "bytom_claim_unsigned", "bytom_claim_signed",
+    "bytom_refund_unsigned", "bytom_refund_signed"
+])
+
+# Bytom unit from symbol -> (numerator, denominator, cast), with BTM, mBTM, NEU = (1, 1000, 100_000_000)
+_UNIT_FACTORS: Dict[str, Tuple[int, int, type]] = {
+    "BTM2mBTM": (1000, 1, float),
+    "BTM2NEU": (100_000_000, 1, int),
+    "mBTM2BTM": (1, 1000, float),
+    "mBTM2NEU": (100_000_000, 1000, int),
+    "NEU2BTM": (1, 100_000_000, float),
+    "NEU2mBTM": (1000, 100_000_000, int)
+}
+
+# Bytom address length -> address type
+_ADDRESS_TYPES: Dict[int, str] = {
+    42: "p2wpkh",
+    62: "p2wsh"
+}
+
+# Wallet balance cache time to live (seconds) and shared (address, asset, network) -> (fetched at, balance) cache
+BALANCE_CACHE_TTL: float = 2.0
+BALANCE_CACHE: Dict[Tuple[str, str, str], Tuple[float, int]] = {}
+
+# Bytom network -> decode/submit transaction raw API urls
+_DECODE_URLS: Dict[str, str] = {
+    network: f"{config[network]['bytom-core']}/decode-raw-transaction"
+    for network in ["mainnet", "solonet", "testnet"]
+}
+_SUBMIT_URLS: Dict[str, str] = {
+    network: f"{config[network]['blockcenter']}/merchant/submit-payment"
+    for network in ["mainnet", "solonet", "testnet"]
+}
+
+
+def clear_balance_cache() -> None:
+    """
+    Clear cached Bytom wallet balances.
+
+    :returns: None
+
+    >>> from swap.providers.bytom.utils import clear_balance_cache
+    >>> clear_balance_cache()
+    """
+
+    BALANCE_CACHE.clear()
+
 
 def amount_unit_converter(amount: Union[int, float], unit_from: str = "NEU2BTM") -> Union[int, float]:
     """
@@ -31,26 +91,13 @@ def amount_unit_converter(amount: Union[int, float], unit_from: str = "NEU2BTM")
     0.1
     """
 
-    if unit_from not in ["BTM2mBTM", "BTM2NEU", "mBTM2BTM", "mBTM2NEU", "NEU2BTM", "NEU2mBTM"]:
+    if unit_from not in _UNIT_FACTORS:
         raise UnitError(f"Invalid Bytom '{unit_from}' unit from",
                         "choose only 'BTM2mBTM', 'BTM2NEU', 'mBTM2BTM', 'mBTM2NEU', "
                         "'NEU2BTM' or 'NEU2mBTM' units.")
 
-    # Constant unit values
-    BTM, mBTM, NEU = (1, 1000, 100_000_000)
-
-    if unit_from == "BTM2mBTM":
-        return float((amount * mBTM) / BTM)
-    elif unit_from == "BTM2NEU":
-        return int((amount * NEU) / BTM)
-    elif unit_from == "mBTM2BTM":
-        return float((amount * BTM) / mBTM)
-    elif unit_from == "mBTM2NEU":
-        return int((amount * NEU) / mBTM)
-    elif unit_from == "NEU2BTM":
-        return float((amount * BTM) / NEU)
-    elif unit_from == "NEU2mBTM":
-        return int((amount * mBTM) / NEU)
+    numerator, denominator, cast = _UNIT_FACTORS[unit_from]
+    return cast((amount * numerator) / denominator)
 
 
 def get_address_type(address: str) -> Optional[str]:
@@ -70,12 +117,7 @@ def get_address_type(address: str) -> Optional[str]:
     if not is_address(address=address):
         raise AddressError(f"Invalid Bytom '{address}' address.")
 
-    if len(address) == 42:
-        return "p2wpkh"
-    elif len(address) == 62:
-        return "p2wsh"
-    else:
-        return None
+    return _ADDRESS_TYPES.get(len(address))
 
 
 def is_network(network: str) -> bool:
@@ -97,6 +139,14 @@ def is_network(network: str) -> bool:
     return network in ["mainnet", "solonet", "testnet"]
 
 
+@lru_cache(maxsize=1024)
+def _is_address(address: str, network: Optional[str]) -> bool:
+    # pybytom verifies the bech32 checksum in pure Python, remember recent results
+    if network is None:
+        return btm_is_address(address=address, vapor=False)
+    return btm_is_address(address=address, network=network, vapor=False)
+
+
 def is_address(address: str, network: Optional[str] = None, address_type: Optional[str] = None) -> bool:
     """
     Check Bytom address.
@@ -120,18 +170,45 @@ def is_address(address: str, network: Optional[str] = None, address_type: Option
     if address_type and address_type not in ["p2wpkh", "p2wsh"]:
         raise TypeError("Address type must be str and choose only 'p2wpkh' or 'p2wsh' types.")
 
-    if network is None:
-        valid = btm_is_address(address=address, vapor=False)
-    elif not is_network(network=network):
+    if network is not None and not is_network(network=network):
         raise NetworkError(f"Invalid Bytom '{network}' network",
                            "choose only 'mainnet', 'solonet' or 'testnet' networks.")
-    else:
-        valid = btm_is_address(address=address, network=network, vapor=False)
+    valid = _is_address(address=address, network=network)
     if address_type:
-        return True if valid and (get_address_type(address=address) == address_type) else False
+        # Address is already verified, so the type only depends on its length
+        return True if valid and (_ADDRESS_TYPES.get(len(address)) == address_type) else False
     return valid
 
 
+def load_transaction_raw(transaction_raw: str) -> Optional[dict]:
+    """
+    Load Bytom transaction raw.
+
+    :param transaction_raw: Bytom transaction raw.
+    :type transaction_raw: str
+
+    :returns: dict -- Loaded Bytom transaction raw, None when it's not a valid one.
+
+    >>> from swap.providers.bytom.utils import load_transaction_raw
+    >>> transaction_raw = "eyJmZWUiOiA0NDkwMDAsICJhZGRyZXNzIjogImJtMXE5cjNwOXI3YWQ3bWplYXJxdTl5ZHM2ZWxmdWxuZjY2d2FldDd6dCIsICJyYXciOiAiMDcwMTAwMDEwMTVmMDE1ZDA3MWI3MjdiOTFlZTg2MzM2NjY3NmNhZDdmOTI4Nzc5NjIyN2I0NTkyN2IwMWEzZDVmOTIyOGQyZGEyOTcwYjhmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmODA4ZGU4NGIwMTAxMTYwMDE0MjhlMjEyOGZkZDZmYjcyY2Y0NjBlMTQ4ZDg2YjNmNGYzZjM0ZWI0ZTIyMDEyMDVkZTczM2NmNWUwODlhZDZhMGQxOGJkZWU1ODYxMWVkNjNmNzc4OTdhYTM1Mjk5YzU5YjY4Mzc4ODY4ZTA1YjUwMjAxNDhmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmOThmOWM2MDQwMTIyMDAyMDdiODJiMDY2YmMyZGRmZjUyZDc4ODA0YjFhM2ExYmU4MzJmYjUyN2RmNjdlZGVjZGM1MGEzYWQyZDViMjAyYzIwMDAxM2NmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmODBlMDg1NDcwMTE2MDAxNDI4ZTIxMjhmZGQ2ZmI3MmNmNDYwZTE0OGQ4NmIzZjRmM2YzNGViNGUwMCIsICJoYXNoIjogImIxNWQyYjgyZjE3N2IyYmI0MTE5NTZiMTFjNzIyMDE0N2M4Mjg0MDNiNzY5ZTY4ZDY5YjM0Y2UxYzE3OWQ4NWUiLCAidW5zaWduZWRfZGF0YXMiOiBbeyJkYXRhcyI6IFsiNzY0MGY1OTExNzZhOWU3MWExZTBjMDNkMzY2YTU5NmNjYTA4NjVlYmUyN2NmZDg1YjcxYWZmMzBiMTcyNTY5OCJdLCAicHVibGljX2tleSI6ICI1ZGU3MzNjZjVlMDg5YWQ2YTBkMThiZGVlNTg2MTFlZDYzZjc3ODk3YWEzNTI5OWM1OWI2ODM3ODg2OGUwNWI1IiwgIm5ldHdvcmsiOiAibWFpbm5ldCIsICJwYXRoIjogIm0vNDQvMTUzLzEvMC8xIn1dLCAic2lnbmF0dXJlcyI6IFtdLCAibmV0d29yayI6ICJtYWlubmV0IiwgInR5cGUiOiAiYnl0b21fZnVuZF91bnNpZ25lZCJ9"
+    >>> load_transaction_raw(transaction_raw=transaction_raw)
+    {'fee': 449000, 'address': 'bm1q9r3p9r7ad7mjearqu9yds6elfulnf66waet7zt', 'raw': '...', 'hash': 'b15d2b82f177b2bb411956b11c7220147c828403b769e68d69b34ce1c179d85e', 'unsigned_datas': [...], 'signatures': [], 'network': 'mainnet', 'type': 'bytom_fund_unsigned'}
+    """
+
+    if not isinstance(transaction_raw, str):
+        raise TypeError(f"Transaction raw must be str, not '{type(transaction_raw)}' type.")
+
+    try:
+        # Raw is base64 ascii, decode bytes straight into the JSON loader
+        decoded_transaction_raw: bytes = b64decode(clean_transaction_raw(transaction_raw).encode("ascii"), validate=False)
+        loaded_transaction_raw = json_loads(decoded_transaction_raw)
+        if loaded_transaction_raw["type"] in _TRANSACTION_RAW_TYPES:
+            return loaded_transaction_raw
+        return None
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeDecodeError):
+        return None
+
+
 def is_transaction_raw(transaction_raw: str) -> bool:
     """
     Check Bytom transaction raw.
@@ -147,21 +224,7 @@ def is_transaction_raw(transaction_raw: str) -> bool:
     True
     """
 
-    if not isinstance(transaction_raw, str):
-        raise TypeError(f"Transaction raw must be str, not '{type(transaction_raw)}' type.")
-
-    try:
-        transaction_raw = clean_transaction_raw(transaction_raw)
-        decoded_transaction_raw = b64decode(transaction_raw.encode())
-        loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-        return loaded_transaction_raw["type"] in [
-            "bytom_normal_unsigned", "bytom_normal_signed",
-            "bytom_fund_unsigned", "bytom_fund_signed",
-            "bytom_claim_unsigned", "bytom_claim_signed",
-            "bytom_refund_unsigned", "bytom_refund_signed"
-        ]
-    except:
-        return False
+    return load_transaction_raw(transaction_raw=transaction_raw) is not None
 
 
 def decode_transaction_raw(transaction_raw: str, headers: dict = config["headers"],
@@ -184,17 +247,14 @@ def decode_transaction_raw(transaction_raw: str, headers: dict = config["headers
     {'fee': ..., 'type': '...', 'address': '...', 'transaction': {...}, 'unsigned_datas': [...], 'signatures': [...], 'network': '...'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw: Optional[dict] = load_transaction_raw(transaction_raw=transaction_raw)
+    if loaded_transaction_raw is None:
         raise TransactionRawError("Invalid Bytom transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
-    url = f"{config[loaded_transaction_raw['network']]['bytom-core']}/decode-raw-transaction"
+    url = _DECODE_URLS[loaded_transaction_raw["network"]]
     data = dict(raw_transaction=loaded_transaction_raw["raw"])
-    response = requests.post(
-        url=url, data=json.dumps(data), headers=headers, timeout=timeout
+    response = _SESSION.post(
+        url=url, data=json_dumps(data), headers=headers, timeout=timeout
     )
     response_json = response.json()
     if response.status_code == 400:
@@ -231,27 +291,26 @@ def submit_transaction_raw(transaction_raw: str, headers: dict = config["headers
     {'fee': ..., 'type': '...', 'transaction_id': '...', 'network': '...', 'date': '...'}
     """
 
-    if not is_transaction_raw(transaction_raw=transaction_raw):
+    loaded_transaction_raw: Optional[dict] = load_transaction_raw(transaction_raw=transaction_raw)
+    if loaded_transaction_raw is None:
         raise TransactionRawError("Invalid Bytom transaction raw.")
 
-    transaction_raw = clean_transaction_raw(transaction_raw)
-    decoded_transaction_raw = b64decode(transaction_raw.encode())
-    loaded_transaction_raw = json.loads(decoded_transaction_raw.decode())
-
-    url = f"{config[loaded_transaction_raw['network']]['blockcenter']}/merchant/submit-payment"
+    url = _SUBMIT_URLS[loaded_transaction_raw["network"]]
     data = dict(raw_transaction=loaded_transaction_raw["raw"], signatures=loaded_transaction_raw["signatures"])
     params = dict(address=loaded_transaction_raw["address"])
-    response = requests.post(
-        url=url, data=json.dumps(data), params=params, headers=headers, timeout=timeout
+    response = _SESSION.post(
+        url=url, data=json_dumps(data), params=params, headers=headers, timeout=timeout
     )
     response_json = response.json()
     if response_json["code"] != 200 and response_json["code"] != 200:
         raise APIError(response_json["msg"], response_json["code"])
+    # Submitted transaction changes the sender, recipient and HTLC balances
+    clear_balance_cache()
 
     return dict(
         fee=loaded_transaction_raw["fee"],
         type=loaded_transaction_raw["type"],
         transaction_id=response_json["data"]["tx_hash"],
         network=loaded_transaction_raw["network"],
-        date=str(datetime.datetime.now())
+        date=datetime.datetime.now().isoformat(sep=" ", timespec="seconds")
     )
@@ -3,9 +3,11 @@
 from pybytom.wallet import Wallet as HDWallet
 from pybytom.rpc import account_create
 from typing import (
-    Optional, List, Union
+    Optional, List, Union, Callable, Any, Dict, Tuple
 )
 
+import time
+
 from ...utils import is_mnemonic
 from ...exceptions import (
     NetworkError, UnitError
@@ -13,6 +15,7 @@ from ...exceptions import (
 from ..config import vapor as config
 from .assets import AssetNamespace
 from .utils import amount_unit_converter
+from . import utils
 from .rpc import (
     get_balance, get_utxos
 )
@@ -39,6 +42,8 @@ class Wallet(HDWallet):
     def __init__(self, network: str = config["network"]):
 
         self._public_key: Optional[str] = None
+        # Derived keys and address cache, cleared whenever the derivation changes
+        self._derivation_cache: dict = {}
 
         if network == "mainnet":
             self._network: str = "mainnet"
@@ -54,6 +59,12 @@ class Wallet(HDWallet):
                                "choose only 'mainnet', 'solonet' or 'testnet' networks.")
         super().__init__(network=self._network)
 
+    def _cached(self, key: str, derive: Callable[[], Any]) -> Any:
+        # Derived values only change with the derivation, so compute each of them once
+        if key not in self._derivation_cache:
+            self._derivation_cache[key] = derive()
+        return self._derivation_cache[key]
+
     def from_entropy(self, entropy: str, language: str = "english", passphrase: Optional[str] = None) -> "Wallet":
         """
         Initiate Vapor wallet from entropy.
@@ -74,6 +85,7 @@ class Wallet(HDWallet):
         """
 
         self._hdwallet.from_entropy(entropy=entropy, language=language, passphrase=passphrase)
+        self._derivation_cache.clear()
         return self
 
     def from_mnemonic(self, mnemonic: str, language: Optional[str] = None,
@@ -101,6 +113,7 @@ class Wallet(HDWallet):
             raise ValueError("Invalid Mnemonic words.")
 
         self._hdwallet.from_mnemonic(mnemonic=mnemonic, language=language, passphrase=passphrase)
+        self._derivation_cache.clear()
         return self
 
     def from_seed(self, seed: str) -> "Wallet":
@@ -119,6 +132,7 @@ class Wallet(HDWallet):
         """
 
         self._hdwallet.from_seed(seed=seed)
+        self._derivation_cache.clear()
         return self
 
     def from_xprivate_key(self, xprivate_key: str) -> "Wallet":
@@ -137,6 +151,7 @@ class Wallet(HDWallet):
         """
 
         self._hdwallet.from_xprivate_key(xprivate_key=xprivate_key)
+        self._derivation_cache.clear()
         return self
 
     def from_private_key(self, private_key: str) -> "Wallet":
@@ -155,6 +170,7 @@ class Wallet(HDWallet):
         """
 
         self._hdwallet.from_private_key(private_key=private_key)
+        self._derivation_cache.clear()
         return self
 
     def from_path(self, path: str) -> "Wallet":
@@ -174,6 +190,7 @@ class Wallet(HDWallet):
         """
 
         self._hdwallet.from_path(path=path)
+        self._derivation_cache.clear()
         return self
 
     def from_indexes(self, indexes: List[str]) -> "Wallet":
@@ -193,6 +210,7 @@ class Wallet(HDWallet):
         """
 
         self._hdwallet.from_indexes(indexes=indexes)
+        self._derivation_cache.clear()
         return self
 
     def from_index(self, index: int, harden: bool = False) -> "Wallet":
@@ -218,6 +236,7 @@ class Wallet(HDWallet):
         """
 
         self._hdwallet.from_index(index=index, harden=harden)
+        self._derivation_cache.clear()
         return self
 
     def clean_derivation(self) -> "Wallet":
@@ -242,6 +261,7 @@ class Wallet(HDWallet):
         """
 
         self._hdwallet.clean_derivation()
+        self._derivation_cache.clear()
         return self
 
     def strength(self) -> Optional[int]:
@@ -379,7 +399,7 @@ class Wallet(HDWallet):
         "205b15f70e253399da90b127b074ea02904594be9d54678207872ec1ba31ee51ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b"
         """
 
-        return self._hdwallet.xprivate_key()
+        return self._cached("xprivate_key", self._hdwallet.xprivate_key)
 
     def xpublic_key(self) -> Optional[str]:
         """
@@ -394,7 +414,7 @@ class Wallet(HDWallet):
         "16476b7fd68ca2acd92cfc38fa353e75d6103f828276f44d587e660a6bd7a5c5ef4490504bd2b6f997113671892458830de09518e6bd5958d5d5dd97624cfa4b"
         """
 
-        return self._hdwallet.xpublic_key()
+        return self._cached("xpublic_key", self._hdwallet.xpublic_key)
 
     def expand_xprivate_key(self) -> Optional[str]:
         """
@@ -409,7 +429,7 @@ class Wallet(HDWallet):
         "205b15f70e253399da90b127b074ea02904594be9d54678207872ec1ba31ee5102416c643cfb46ab1ae5a524c8b4aaa002eb771d0d9cfc7490c0c3a8177e053e"
         """
 
-        return self._hdwallet.expand_xprivate_key()
+        return self._cached("expand_xprivate_key", self._hdwallet.expand_xprivate_key)
 
     def child_xprivate_key(self) -> Optional[str]:
         """
@@ -425,7 +445,7 @@ class Wallet(HDWallet):
         "e07af52746e7cccd0a7d1fba6651a6f474bada481f34b1c5bab5e2d71e36ee515803ee0a6682fb19e279d8f4f7acebee8abd0fc74771c71565f9a9643fd77141"
         """
 
-        return self._hdwallet.child_xprivate_key()
+        return self._cached("child_xprivate_key", self._hdwallet.child_xprivate_key)
 
     def child_xpublic_key(self) -> Optional[str]:
         """
@@ -441,7 +461,7 @@ class Wallet(HDWallet):
         "91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e25803ee0a6682fb19e279d8f4f7acebee8abd0fc74771c71565f9a9643fd77141"
         """
 
-        return self._hdwallet.child_xpublic_key()
+        return self._cached("child_xpublic_key", self._hdwallet.child_xpublic_key)
 
     def guid(self) -> Optional[str]:
         """
@@ -474,7 +494,7 @@ class Wallet(HDWallet):
         "e07af52746e7cccd0a7d1fba6651a6f474bada481f34b1c5bab5e2d71e36ee515803ee0a6682fb19e279d8f4f7acebee8abd0fc74771c71565f9a9643fd77141"
         """
 
-        return self._hdwallet.private_key()
+        return self._cached("private_key", self._hdwallet.private_key)
 
     def public_key(self) -> str:
         """
@@ -490,7 +510,7 @@ class Wallet(HDWallet):
         "91ff7f525ff40874c4f47f0cab42e46e3bf53adad59adef9558ad1b6448f22e2"
         """
 
-        return self._hdwallet.public_key()
+        return self._cached("public_key", self._hdwallet.public_key)
 
     def program(self) -> str:
         """
@@ -506,7 +526,7 @@ class Wallet(HDWallet):
         "00142cda4f99ea8112e6fa61cdd26157ed6dc408332a"
         """
 
-        return self._hdwallet.program()
+        return self._cached("program", self._hdwallet.program)
 
     def address(self, network: Optional[str] = None) -> str:
         """
@@ -526,10 +546,12 @@ class Wallet(HDWallet):
 
         if network is None:
             network = self._network
-        return self._hdwallet.address(network=network, vapor=True)
+        return self._cached(
+            f"address:{network}", lambda: self._hdwallet.address(network=network, vapor=True)
+        )
 
     def balance(self, asset: Union[str, AssetNamespace] = config["asset"],
-                unit: str = config["unit"]) -> Union[int, float]:
+                unit: str = config["unit"], cache: bool = True) -> Union[int, float]:
         """
         Get Vapor wallet balance.
 
@@ -537,9 +559,17 @@ class Wallet(HDWallet):
         :type asset: str, vapor.assets.AssetNamespace
         :param unit: Vapor unit, default to NEU.
         :type unit: str
+        :param cache: Use the cached balance while it's fresh, defaults to True.
+        :type cache: bool
 
         :return: int, float -- Vapor wallet balance.
 
+        .. note::
+            Balances are cached for ``swap.providers.vapor.utils.BALANCE_CACHE_TTL`` seconds per address,
+            asset and network, so a transaction broadcast from elsewhere can take that long to show up.
+            Pass ``cache=False`` to fetch the balance anyway, submitting with ``submit_transaction_raw``
+            clears the cache.
+
         >>> from swap.providers.vapor.wallet import Wallet
         >>> wallet = Wallet(network="mainnet")
         >>> wallet.from_entropy("72fee73846f2d1a5807dc8c953bf79f1")
@@ -550,11 +580,23 @@ class Wallet(HDWallet):
 
         if unit not in ["BTM", "mBTM", "NEU"]:
             raise UnitError("Invalid Vapor unit, choose only BTM, mBTM or NEU units.")
-        _balance: int = get_balance(
-            address=self.address(),
-            asset=(str(asset.ID) if isinstance(asset, AssetNamespace) else asset),
-            network=self._network
-        )
+        address: str = self.address()
+        asset_id: str = (str(asset.ID) if isinstance(asset, AssetNamespace) else asset)
+        key: Tuple[str, str, str] = (address, asset_id, self._network)
+        # Read time to live on each call, so changing utils.BALANCE_CACHE_TTL takes effect
+        ttl: float = utils.BALANCE_CACHE_TTL
+        cached: Optional[Tuple[float, int]] = utils.BALANCE_CACHE.get(key) if cache else None
+        if cached is not None and (time.monotonic() - cached[0]) < ttl:
+            _balance: int = cached[1]
+        else:
+            _balance: int = get_balance(
+                address=address, asset=asset_id, network=self._network
+            )
+            now: float = time.monotonic()
+            # Drop expired balances, so the cache only keeps recently used wallets
+            for expired in [_key for _key, (fetched, _) in utils.BALANCE_CACHE.items() if (now - fetched) >= ttl]:
+                del utils.BALANCE_CACHE[expired]
+            utils.BALANCE_CACHE[key] = (now, _balance)
         return _balance if unit == "NEU" else \
             amount_unit_converter(amount=_balance, unit_from=f"NEU2{unit}")
 
@@ -7,13 +7,20 @@ from binascii import (
 )
 from random import choice
 from typing import (
-    Optional, Union
+    Optional, Union, Any
 )
 
 import unicodedata
 import string
 import os
 import hashlib
+import json
+
+try:
+    # Optional faster JSON backend
+    import orjson
+except ImportError:
+    orjson = None
 
 # Alphabet and digits.
 letters = string.ascii_letters + string.digits
@@ -306,8 +313,8 @@ def sha256(data: Union[str, bytes]) -> str:
     """
 
     if isinstance(data, str):
-        return hashlib.sha256(data.encode()).digest().hex()
-    return hashlib.sha256(data).digest().hex()
+        return hashlib.sha256(data.encode()).hexdigest()
+    return hashlib.sha256(data).hexdigest()
 
 
 def double_sha256(data: Union[str, bytes]) -> str:
@@ -322,7 +329,10 @@ def double_sha256(data: Union[str, bytes]) -> str:
     >>> double_sha256(data="Hello Meheret!")
     "821124b554d13f247b1e5d10b84e44fb1296f18f38bbaa1bea34a12c843e0158"
     """
-    return hashlib.sha256(unhexlify(sha256(data))).digest().hex()
+
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.sha256(hashlib.sha256(data).digest()).hexdigest()
 
 
 def clean_transaction_raw(transaction_raw: str) -> str:
@@ -338,3 +348,41 @@ def clean_transaction_raw(transaction_raw: str) -> str:
     "eyJmZWUiOiAxMDAwMDAwMCwgImFkZHJlc3MiOiAiYm0xcTluZHlseDAyc3lmd2Q3bnBlaGZ4ejRsZGRoenFzdmUyZnU2dmM3IiwgInJhdyI6ICIwNzAxMDAwMjAxNWYwMTVkODJlNjVmOTY0ZDNjMzUzMjU0OGRmZGU5Mzg0NjJmNTY2Yzk1ZDNjOTBlNmEzYTE4MmEwYjNiZGFlNDZhYTc5MGZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmY4MDg2ZjIwMzAxMDExNjAwMTQyY2RhNGY5OWVhODExMmU2ZmE2MWNkZDI2MTU3ZWQ2ZGM0MDgzMzJhMjIwMTIwOTFmZjdmNTI1ZmY0MDg3NGM0ZjQ3ZjBjYWI0MmU0NmUzYmY1M2FkYWQ1OWFkZWY5NTU4YWQxYjY0NDhmMjJlMjAxNWYwMTVkMDcwZDBlYjIyZDMyYjgyZDNkMmYzZmM0YmFmYjdhODVmNTIyOWY3ZmQ4OTA0MmQyZmYzMjU3Mzc1ZTQzZDNlYmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmOGY1Zjc0ZjAxMDExNjAwMTQyY2RhNGY5OWVhODExMmU2ZmE2MWNkZDI2MTU3ZWQ2ZGM0MDgzMzJhMjIwMTIwOTFmZjdmNTI1ZmY0MDg3NGM0ZjQ3ZjBjYWI0MmU0NmUzYmY1M2FkYWQ1OWFkZWY5NTU4YWQxYjY0NDhmMjJlMjAyMDE0NmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmY5MDRlMDEyMjAwMjA0ZjhmMGU4OGQwYTQ0YjNkODg0YjA3YjZkZDQ1MzY1MThmZmNiYjU5NmE5MWNhMGU2YjJmMzdlOTY0NjNiYmZjMDAwMTNjZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmZmQ4YjhmODUyMDExNjAwMTQyY2RhNGY5OWVhODExMmU2ZmE2MWNkZDI2MTU3ZWQ2ZGM0MDgzMzJhMDAiLCAiaGFzaCI6ICI1MGIzMzZhYjZlMDU1ZDlkNGQ2NWE5ZjIyOTViNTMyNzBhYmQzODE2YzIzYmE0Yzk1NDg0MWYzOTlhYTc3MmQ1IiwgInVuc2lnbmVkX2RhdGFzIjogW3siZGF0YXMiOiBbImY3ZDNhYTE4YjI5NWNkYTZmMmIxMTMyYzQyMzE5MzNjYzkyZjNiYWNhNzA1OTc0YzVkZTM3OGY5YjY5NWYwZTIiXSwgInB1YmxpY19rZXkiOiAiOTFmZjdmNTI1ZmY0MDg3NGM0ZjQ3ZjBjYWI0MmU0NmUzYmY1M2FkYWQ1OWFkZWY5NTU4YWQxYjY0NDhmMjJlMiIsICJuZXR3b3JrIjogIm1haW5uZXQiLCAicGF0aCI6ICJtLzQ0LzE1My8xLzAvMSJ9LCB7ImRhdGFzIjogWyJjYTYxNWJhMmM3MjllNDYzZmJmNzlhMTE0MTkxNzYyNjFiMWJmNmJlNDQ4MTMzMzVkMmIyNTZlOGE3YmJjZWVlIl0sICJwdWJsaWNfa2V5IjogIjkxZmY3ZjUyNWZmNDA4NzRjNGY0N2YwY2FiNDJlNDZlM2JmNTNhZGFkNTlhZGVmOTU1OGFkMWI2NDQ4ZjIyZTIiLCAibmV0d29yayI6ICJtYWlubmV0IiwgInBhdGgiOiAibS80NC8xNTMvMS8wLzEifV0sICJzaWduYXR1cmVzIjogW10sICJuZXR3b3JrIjogIm1haW5uZXQiLCAidHlwZSI6ICJieXRvbV9mdW5kX3Vuc2lnbmVkIn0="
     """
     return str(transaction_raw + "=" * (-len(transaction_raw) % 4))
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Load JSON data, uses orjson when it's installed.
+
+    :param data: JSON string/bytes data.
+    :type data: str, bytes
+    :returns: Any -- Loaded JSON data.
+
+    >>> from swap.utils import json_loads
+    >>> json_loads(data=b'{"network": "mainnet"}')
+    {'network': 'mainnet'}
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode()
+    return json.loads(data)
+
+
+def json_dumps(data: Any) -> bytes:
+    """
+    Dump JSON data to compact bytes, uses orjson when it's installed.
+
+    :param data: Any JSON serializable data.
+    :type data: Any
+    :returns: bytes -- Dumped JSON data.
+
+    >>> from swap.utils import json_dumps
+    >>> json_dumps(data={"network": "mainnet"})
+    b'{"network":"mainnet"}'
+    """
+
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
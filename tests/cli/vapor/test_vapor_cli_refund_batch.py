@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+
+from base64 import b64decode
+
+import json
+import os
+
+from swap.cli.__main__ import main as cli_main
+from swap.providers.vapor import transaction
+from swap.utils import clean_transaction_raw
+
+# Test Values
+base_path = os.path.dirname(__file__)
+file_path = os.path.abspath(os.path.join(base_path, "..", "..", "values.json"))
+values = open(file_path, "r")
+_ = json.loads(values.read())
+values.close()
+
+
+def test_vapor_cli_refund_many(cli_tester, tmp_path):
+
+    rows_path = tmp_path / "refunds.csv"
+    rows_path.write_text(
+        f"{_['vapor']['transaction_id']},{_['vapor']['amount']}\n\n"
+        f"{_['vapor']['transaction_id']},{_['vapor']['amount']}\n"
+    )
+
+    refund_many = cli_tester.invoke(
+        cli_main, [
+            "vapor",
+            "refund-many",
+            "--address", _["vapor"]["wallet"]["sender"]["address"],
+            "--file", str(rows_path),
+            "--asset", _["vapor"]["asset"],
+            "--max-amount", _["vapor"]["max_amount"],
+            "--unit", _["vapor"]["unit"],
+            "--network", _["vapor"]["network"]
+        ]
+    )
+
+    transaction_raw = clean_transaction_raw(
+        transaction_raw=_["vapor"]["refund"]["unsigned"]["transaction_raw"]
+    )
+    assert refund_many.exit_code == 0
+    assert refund_many.output == transaction_raw + "\n" + transaction_raw + "\n"
+
+
+# Fund transaction id -> HTLC UTXO, used by the mocked RPC calls below
+htlc_utxos = {
+    "a": dict(id="utxo-a", address=_["vapor"]["htlc"]["address"], amount=5_000_000_000),
+    "b": dict(id="utxo-b", address=_["vapor"]["wallet"]["recipient"]["address"], amount=7_000_000_000)
+}
+
+
+def mock_refund_rpc(monkeypatch) -> list:
+    # Mock Vapor RPC calls so each row builds offline, returns fetched transaction ids
+    fetched_transaction_ids = []
+
+    def get_transaction(transaction_id, network):
+        fetched_transaction_ids.append(transaction_id)
+        return dict(id=transaction_id)
+
+    monkeypatch.setattr(transaction, "get_transaction", get_transaction)
+    monkeypatch.setattr(transaction, "find_p2wsh_utxo", lambda transaction: htlc_utxos.get(transaction["id"]))
+    monkeypatch.setattr(transaction, "estimate_transaction_fee", lambda **kwargs: 10_000_000)
+    monkeypatch.setattr(transaction, "build_transaction", lambda address, transaction, network: dict(
+        raw_transaction=f"raw-{transaction['inputs'][0]['output_id']}",
+        tx=dict(hash=f"hash-{transaction['inputs'][0]['output_id']}"),
+        signing_instructions=[]
+    ))
+    return fetched_transaction_ids
+
+
+def test_vapor_cli_refund_many_different_transaction_ids(cli_tester, tmp_path, monkeypatch):
+
+    fetched_transaction_ids = mock_refund_rpc(monkeypatch)
+
+    rows_path = tmp_path / "refunds.csv"
+    rows_path.write_text("a\nb\na\n")
+
+    refund_many = cli_tester.invoke(
+        cli_main, [
+            "vapor",
+            "refund-many",
+            "--address", _["vapor"]["wallet"]["sender"]["address"],
+            "--file", str(rows_path),
+            "--unit", "NEU",
+            "--network", _["vapor"]["network"]
+        ]
+    )
+
+    assert refund_many.exit_code == 0
+    loaded_transaction_raws = [
+        json.loads(b64decode(clean_transaction_raw(transaction_raw=transaction_raw)).decode())
+        for transaction_raw in refund_many.output.splitlines()
+    ]
+    assert fetched_transaction_ids == ["a", "b"]
+    assert [loaded_transaction_raw["datas"] for loaded_transaction_raw in loaded_transaction_raws] == [
+        dict(address=_["vapor"]["wallet"]["sender"]["address"], htlc_address=htlc_utxos["a"]["address"], amount=4_990_000_000),
+        dict(address=_["vapor"]["wallet"]["sender"]["address"], htlc_address=htlc_utxos["b"]["address"], amount=6_990_000_000),
+        dict(address=_["vapor"]["wallet"]["sender"]["address"], htlc_address=htlc_utxos["a"]["address"], amount=4_990_000_000)
+    ]
+    assert [loaded_transaction_raw["raw"] for loaded_transaction_raw in loaded_transaction_raws] == [
+        "raw-utxo-a", "raw-utxo-b", "raw-utxo-a"
+    ]
+
+
+def test_vapor_cli_refund_many_failed_rows(cli_tester, tmp_path, monkeypatch):
+
+    mock_refund_rpc(monkeypatch)
+
+    rows_path = tmp_path / "refunds.csv"
+    rows_path.write_text("a\nb,abc\n\nc\nb\n")
+
+    refund_many = cli_tester.invoke(
+        cli_main, [
+            "vapor",
+            "refund-many",
+            "--address", _["vapor"]["wallet"]["sender"]["address"],
+            "--file", str(rows_path),
+            "--unit", "NEU",
+            "--network", _["vapor"]["network"]
+        ]
+    )
+
+    # Failed rows are reported with their line and transaction id, the rest of the batch is still built
+    assert refund_many.exit_code == 1
+    output = refund_many.output.splitlines()
+    assert len(output) == 4
+    assert output[1] == "Error: row 2 (b): could not convert string to float: 'abc'"
+    assert output[2] == "Error: row 4 (c): Invalid transaction id, there is no pay to witness script hash (P2WSH) address."
+    assert [
+        json.loads(b64decode(clean_transaction_raw(transaction_raw=transaction_raw)).decode())["raw"]
+        for transaction_raw in (output[0], output[3])
+    ] == ["raw-utxo-a", "raw-utxo-b"]
@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 
+import pytest
 import json
 import os
 
+from swap.exceptions import NetworkError
 from swap.providers.bytom.signature import (
     Signature, NormalSignature, FundSignature, ClaimSignature, RefundSignature
 )
 from swap.providers.bytom.solver import (
     NormalSolver, FundSolver, ClaimSolver, RefundSolver
 )
+from swap.providers.bytom import transaction
 from swap.utils import clean_transaction_raw
 
 # Test Values
@@ -143,6 +146,65 @@ def test_bytom_claim_signature():
         transaction_raw=_["bytom"]["claim"]["signed"]["transaction_raw"]
     )
 
+    signed_claim_signature = ClaimSignature(network=_["bytom"]["network"]).from_signed_transaction(
+        transaction=claim_signature
+    )
+
+    assert signed_claim_signature.type() == _["bytom"]["claim"]["signed"]["type"]
+    assert signed_claim_signature.fee() == _["bytom"]["claim"]["signed"]["fee"]
+    assert signed_claim_signature.hash() == _["bytom"]["claim"]["signed"]["hash"]
+    assert signed_claim_signature.signatures() == claim_signature.signatures()
+    assert signed_claim_signature.transaction_raw() == claim_signature.transaction_raw()
+
+
+def test_bytom_signature_from_signed_transaction(monkeypatch):
+
+    # Mock Bytom RPC calls, so the claim transaction is built and signed offline
+    monkeypatch.setattr(transaction, "get_transaction", lambda transaction_id, network: dict(outputs=[]))
+    monkeypatch.setattr(transaction, "find_p2wsh_utxo", lambda transaction: dict(
+        id="utxo-a", address=_["bytom"]["htlc"]["address"], amount=10_000_000
+    ))
+    monkeypatch.setattr(transaction, "build_transaction", lambda address, transaction, network: dict(
+        raw_transaction="raw", tx=dict(hash="hash"), signing_instructions=[dict(
+            sign_data=["67" * 32], pubkey=None, derivation_path=None
+        )]
+    ))
+
+    claim_solver = ClaimSolver(
+        xprivate_key=_["bytom"]["wallet"]["recipient"]["xprivate_key"],
+        secret_key=_["bytom"]["htlc"]["secret"]["key"],
+        bytecode=_["bytom"]["htlc"]["bytecode"],
+        path=_["bytom"]["wallet"]["recipient"]["derivation"]["path"]
+    )
+    claim_transaction = transaction.ClaimTransaction(network=_["bytom"]["network"]).build_transaction(
+        address=_["bytom"]["wallet"]["recipient"]["address"], transaction_id="a", max_amount=True, fee=10_000,
+        unit="NEU"
+    )
+
+    with pytest.raises(ValueError, match="Transaction is not signed"):
+        ClaimSignature(network=_["bytom"]["network"]).from_signed_transaction(
+            transaction=claim_transaction
+        )
+
+    claim_transaction.sign(solver=claim_solver)
+    claim_signature = ClaimSignature(network=_["bytom"]["network"]).from_signed_transaction(
+        transaction=claim_transaction
+    )
+
+    assert claim_signature.type() == "bytom_claim_signed"
+    assert claim_signature.fee() == 10_000
+    assert claim_signature.signatures() == claim_transaction.signatures()
+    assert claim_signature.transaction_raw() == claim_transaction.transaction_raw()
+
+    with pytest.raises(TypeError, match="you can't use bytom_claim_signed type by using fund signature"):
+        FundSignature(network=_["bytom"]["network"]).from_signed_transaction(
+            transaction=claim_transaction
+        )
+    with pytest.raises(NetworkError, match="Invalid Bytom 'mainnet' transaction network"):
+        ClaimSignature(network="solonet").from_signed_transaction(
+            transaction=claim_transaction
+        )
+
 
 def test_bytom_refund_signature():
 
@@ -70,3 +70,10 @@ def test_bytom_refund_solver():
 
     assert isinstance(refund_solver.solve(network=_["bytom"]["network"]), tuple)
     assert isinstance(refund_solver.witness(network=_["bytom"]["network"]), str)
+
+    refund_solver = RefundSolver(
+        xprivate_key=_["bytom"]["wallet"]["sender"]["xprivate_key"],
+        bytecode=bytes.fromhex(_["bytom"]["htlc"]["bytecode"])
+    )
+
+    assert refund_solver.witness(network=_["bytom"]["network"]) == _["bytom"]["htlc"]["bytecode"]
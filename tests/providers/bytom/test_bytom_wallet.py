@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 
+from types import SimpleNamespace
+
 import json
 import os
 
+from swap.providers.bytom import wallet as bytom_wallet
+from swap.providers.bytom import utils as bytom_utils
 from swap.providers.bytom.wallet import Wallet
+from swap.providers.bytom.utils import (
+    clear_balance_cache, BALANCE_CACHE, BALANCE_CACHE_TTL
+)
 
 # Test Values
 base_path = os.path.dirname(__file__)
@@ -181,3 +188,95 @@ def test_bytom_wallet_from_private_key():
 
     # assert isinstance(wallet.balance(), int)
     # assert isinstance(wallet.utxos(), list)
+
+
+def test_bytom_wallet_derivation_cache():
+
+    wallet = Wallet(network=_["bytom"]["network"])
+
+    wallet.from_mnemonic(
+        mnemonic=_["bytom"]["wallet"]["sender"]["mnemonic"]
+    )
+    wallet.from_path(
+        path=_["bytom"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    assert wallet.public_key() == _["bytom"]["wallet"]["sender"]["public_key"]
+    assert wallet.address() == _["bytom"]["wallet"]["sender"]["address"]
+
+    wallet.clean_derivation()
+    wallet.from_mnemonic(
+        mnemonic=_["bytom"]["wallet"]["recipient"]["mnemonic"]
+    )
+    wallet.from_path(
+        path=_["bytom"]["wallet"]["recipient"]["derivation"]["path"]
+    )
+
+    assert wallet.xprivate_key() == _["bytom"]["wallet"]["recipient"]["xprivate_key"]
+    assert wallet.public_key() == _["bytom"]["wallet"]["recipient"]["public_key"]
+    assert wallet.address() == _["bytom"]["wallet"]["recipient"]["address"]
+
+
+def test_bytom_wallet_balance_cache(monkeypatch):
+
+    clock, fetches = [100.0], []
+
+    def get_balance(address, asset, network):
+        fetches.append((address, asset, network))
+        return 70_000_000 * len(fetches)
+
+    clear_balance_cache()
+    monkeypatch.setattr(bytom_wallet, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    monkeypatch.setattr(bytom_wallet, "get_balance", get_balance)
+
+    wallet = Wallet(network=_["bytom"]["network"])
+    wallet.from_mnemonic(
+        mnemonic=_["bytom"]["wallet"]["sender"]["mnemonic"]
+    )
+    wallet.from_path(
+        path=_["bytom"]["wallet"]["sender"]["derivation"]["path"]
+    )
+    other_network_wallet = Wallet(network="solonet")
+    other_network_wallet.from_mnemonic(
+        mnemonic=_["bytom"]["wallet"]["sender"]["mnemonic"]
+    )
+    other_network_wallet.from_path(
+        path=_["bytom"]["wallet"]["sender"]["derivation"]["path"]
+    )
+
+    # Within time to live, second call hits the cache
+    assert wallet.balance() == 70_000_000
+    clock[0] += BALANCE_CACHE_TTL / 2
+    assert wallet.balance() == 70_000_000
+    assert wallet.balance(unit="BTM") == 0.7
+    assert len(fetches) == 1
+
+    # Different asset or network misses the cache
+    assert wallet.balance(asset="f37dea62efd2965174b84bbb59a0bd0a671cf5fb2857303ffd77c1b482b84bdf") == 140_000_000
+    assert other_network_wallet.balance() == 210_000_000
+    assert len(fetches) == 3
+    assert fetches[1][1] == "f37dea62efd2965174b84bbb59a0bd0a671cf5fb2857303ffd77c1b482b84bdf"
+    assert fetches[2][2] == "solonet"
+
+    # After expiry, balance is fetched again and expired entries are dropped
+    clock[0] += BALANCE_CACHE_TTL
+    assert wallet.balance() == 280_000_000
+    assert len(fetches) == 4
+    assert list(BALANCE_CACHE.keys()) == [(wallet.address(), _["bytom"]["asset"], _["bytom"]["network"])]
+
+    # Clearing the cache (as submit_transaction_raw does) forces a new fetch
+    clear_balance_cache()
+    assert wallet.balance() == 350_000_000
+    assert len(fetches) == 5
+
+    # One call can skip the cache, its fresh balance is cached for the next calls
+    assert wallet.balance(cache=False) == 420_000_000
+    assert wallet.balance() == 420_000_000
+    assert len(fetches) == 6
+
+    # Time to live is read from utils on each call
+    monkeypatch.setattr(bytom_utils, "BALANCE_CACHE_TTL", 0)
+    assert wallet.balance() == 490_000_000
+    assert wallet.balance() == 560_000_000
+    assert len(fetches) == 8
+    clear_balance_cache()
@@ -70,3 +70,10 @@ def test_vapor_refund_solver():
 
     assert isinstance(refund_solver.solve(network=_["vapor"]["network"]), tuple)
     assert isinstance(refund_solver.witness(network=_["vapor"]["network"]), str)
+
+    refund_solver = RefundSolver(
+        xprivate_key=_["vapor"]["wallet"]["sender"]["xprivate_key"],
+        bytecode=bytes.fromhex(_["vapor"]["htlc"]["bytecode"])
+    )
+
+    assert refund_solver.witness(network=_["vapor"]["network"]) == _["vapor"]["htlc"]["bytecode"]
@@ -8,7 +8,7 @@ import os
 
 from swap.exceptions import APIError
 from swap.providers.vapor.utils import (
-    is_network, is_address, is_transaction_raw, get_address_type,
+    is_network, is_address, is_transaction_raw, load_transaction_raw, get_address_type,
     decode_transaction_raw, submit_transaction_raw
 )
 
@@ -35,6 +35,14 @@ def test_vapor_utils():
 
     assert is_transaction_raw(transaction_raw=_["vapor"]["fund"]["unsigned"]["transaction_raw"])
     assert not is_transaction_raw(transaction_raw="unknown")
+    assert not is_transaction_raw(transaction_raw="e30")  # {}
+    assert not is_transaction_raw(transaction_raw="WyJ0eXBlIl0")  # ["type"]
+    assert not is_transaction_raw(transaction_raw="gA")  # Non UTF-8 bytes
+
+    assert load_transaction_raw(
+        transaction_raw=_["vapor"]["fund"]["unsigned"]["transaction_raw"]
+    )["type"] == _["vapor"]["fund"]["unsigned"]["type"]
+    assert load_transaction_raw(transaction_raw="unknown") is None
 
     assert get_address_type(address=_["vapor"]["wallet"]["sender"]["address"]) == "p2wpkh"
     assert get_address_type(address=_["vapor"]["wallet"]["recipient"]["address"]) == "p2wpkh"
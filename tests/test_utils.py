@@ -2,7 +2,8 @@
 
 from swap.utils import (
     generate_passphrase, generate_entropy, generate_mnemonic,
-    is_mnemonic, get_mnemonic_language, sha256, double_sha256
+    is_mnemonic, get_mnemonic_language, sha256, double_sha256,
+    json_loads, json_dumps
 )
 
 import pytest
@@ -55,3 +56,8 @@ def test_swap_utils():
 
     assert double_sha256("meherett".encode()) == \
         "2803bf9ed1e5874825350b1b0753a96c00a99236b686bde337404453b11d3288"
+
+    assert json_loads(json_dumps({"network": "mainnet", "fee": 10_000_000})) == \
+        {"network": "mainnet", "fee": 10_000_000}
+
+    assert json_loads('{"type": "bytom_claim_unsigned"}') == {"type": "bytom_claim_unsigned"}